@@ -1,23 +1,51 @@
-from typing import List, Tuple, Optional, Any
-from WordleHelper import WordleHelper
+from typing import List, Tuple, Optional, Any, NamedTuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from WordleHelper import WordleHelper, NUMBA_AVAILABLE, top_k_indices
+from wordle_copy import WordleGame
+import numpy as np
 import random
 
+# Strategies whose guesses use the feedback pattern matrix
+_PATTERN_STRATEGIES = ("elimination", "adaptive")
+
+# Games each training worker has to play to make up for starting it
+# (importing numpy/numba and building its AI takes most of a second)
+MIN_GAMES_PER_WORKER = 250
+
+
+class GameResult(NamedTuple):
+    """Record of a single training game"""
+    game: int
+    won: bool
+    attempts: int
+    secret_word: str
+    guesses: Tuple[str, ...]
+
+
+class TrainingPool(NamedTuple):
+    """Worker processes started by create_training_pool"""
+    executor: ProcessPoolExecutor
+    num_workers: int
+
 
 class WordleAI:
     """
     AI agent that plays Wordle using various strategies
     """
 
-    def __init__(self, word_list: List[str], strategy: str = "frequency"):
+    def __init__(self, word_list: List[str], strategy: str = "frequency", scoring: str = "letter"):
         """
         Initialize the AI with a word list and strategy
 
         Args:
-            word_list: List of valid 5-letter words
+            word_list: List of valid uppercase 5-letter words
             strategy: Strategy to use ('frequency', 'random', 'elimination', 'adaptive')
+            scoring: How the frequency strategy scores words ('letter', 'positional')
         """
         self.helper = WordleHelper(word_list)
         self.strategy = strategy
+        self.scoring = scoring
         self.guess_history = []
         self.feedback_history = []
 
@@ -40,6 +68,12 @@ class WordleAI:
         Returns:
             The word to guess
         """
+        # Nothing to decide when at most one possibility remains
+        if len(self.helper.idx) <= 1:
+            if len(self.helper.idx):
+                return self.helper.all_words[self.helper.idx[0]]
+            return random.choice(self.helper.all_words)
+
         if self.strategy == "random":
             return self._random_strategy()
         elif self.strategy == "frequency":
@@ -61,27 +95,28 @@ class WordleAI:
         """
         self.guess_history.append(guess)
         self.feedback_history.append(feedback)
-        self.helper.filter_words(guess, feedback)
+        self.helper.filter_idx(guess, feedback)
 
     def _random_strategy(self) -> str:
         """Randomly select from remaining possible words"""
-        if not self.helper.possible_words:
+        if len(self.helper.idx) == 0:
             return random.choice(self.helper.all_words)
-        return random.choice(self.helper.possible_words)
+        return self.helper.all_words[random.choice(self.helper.idx)]
 
     def _frequency_strategy(self, attempt_number: int) -> str:
         """
         Use letter frequency to guide guessing
 
         On first guess: Use pre-computed best starter
-        On subsequent guesses: Pick word with highest frequency score from remaining
+        On subsequent guesses: Pick word with highest score from remaining,
+        using letter frequency or positional entropy depending on self.scoring
         """
         if attempt_number == 1:
             # Use a good starting word
             return self.best_starters[0]
 
         # Use helper to find best word from remaining possibilities
-        return self.helper.get_best_guess(use_remaining_only=True)
+        return self.helper.get_best_guess(use_remaining_only=True, scoring=self.scoring)
 
     def _elimination_strategy(self, attempt_number: int) -> str:
         """
@@ -103,7 +138,7 @@ class WordleAI:
         - Mid game: Switch to frequency when remaining words < 100
         - Late game: Pick from remaining words when < 10 left
         """
-        remaining = len(self.helper.possible_words)
+        remaining = len(self.helper.idx)
 
         if attempt_number == 1:
             # Good starting word
@@ -117,7 +152,7 @@ class WordleAI:
         else:
             # Endgame - just pick from remaining
             if remaining > 0:
-                return self.helper.possible_words[0]
+                return self.helper.all_words[self.helper.idx[0]]
             else:
                 return random.choice(self.helper.all_words)
 
@@ -130,7 +165,7 @@ class WordleAI:
         """
         return {
             "attempts_made": len(self.guess_history),
-            "remaining_words": len(self.helper.possible_words),
+            "remaining_words": len(self.helper.idx),
             "strategy": self.strategy,
             "guesses": self.guess_history,
         }
@@ -142,16 +177,18 @@ class WordleAI:
         Returns:
             Tuple of (best_guess, top_5_alternatives)
         """
-        if not self.helper.possible_words:
+        if len(self.helper.idx) == 0:
             return None, []
 
-        # Get top scoring words
-        scored = [(word, self.helper.score_word(word))
-                  for word in self.helper.possible_words[:100]]  # Limit for performance
-        scored.sort(key=lambda x: x[1], reverse=True)
+        if len(self.helper.idx) == 1:
+            return self.helper.all_words[self.helper.idx[0]], []
+
+        # Get top scoring words using the AI's scoring method
+        idx = self.helper.idx
+        top = idx[top_k_indices(self.helper.score_candidates(idx, self.scoring), 6)]
 
-        best = scored[0][0] if scored else None
-        alternatives = [word for word, _ in scored[1:6]]
+        best = self.helper.all_words[top[0]]
+        alternatives = [self.helper.all_words[i] for i in top[1:]]
 
         return best, alternatives
 
@@ -162,11 +199,12 @@ class WordleTrainer:
     """
 
     def __init__(self, word_list: List[str]):
-        """Initialize trainer with word list"""
-        self.word_list = [word.upper() for word in word_list if len(word) == 5]
+        """Initialize trainer with a list of uppercase 5-letter words"""
+        self.word_list = word_list
         self.results = []
 
-    def train(self, ai: WordleAI, num_games: int, secret_words: List[str] = None) -> dict:
+    def train(self, ai: WordleAI, num_games: int, secret_words: List[str] = None,
+              num_workers: int = 1, pool: Optional[TrainingPool] = None) -> dict:
         """
         Train the AI by playing multiple games
 
@@ -174,47 +212,34 @@ class WordleTrainer:
             ai: The AI agent to train
             num_games: Number of games to play
             secret_words: Optional list of secret words to use (for testing)
+            num_workers: Number of processes to play games in (1 plays them in this process).
+                         Runs too short to pay for starting the workers are played in this process
+            pool: Pool from create_training_pool to play the games in, reused across
+                  calls instead of starting new workers (num_workers is then ignored)
 
         Returns:
             Dictionary with training statistics
         """
-        from wordle_copy import WordleGame
-
         wins = 0
         total_attempts = 0
         attempt_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
         failures = 0
 
-        for i in range(num_games):
-            # Create a new game
-            if secret_words and i < len(secret_words):
-                # Use provided secret word for testing
-                game = WordleGame(self.word_list)
-                game.secret_word = secret_words[i].upper()
-            else:
-                game = WordleGame(self.word_list)
-
-            ai.reset()
-
-            # Play the game
-            attempts = 0
-            won = False
-
-            while not game.game_over and attempts < 6:
-                attempts += 1
-                guess = ai.make_guess(attempts)
-                success, feedback = game.make_guess(guess)
-
-                if success:
-                    ai.process_feedback(guess, feedback)
-                    if game.won:
-                        won = True
-                        break
-                else:
-                    # Should not happen if AI is working correctly
-                    print(f"Warning: Invalid guess {guess}")
-                    break
+        # Uppercase the provided secret words once rather than per game
+        secret_words = [word.upper() for word in secret_words] if secret_words else None
+
+        if pool is not None:
+            games = self._play_parallel(ai, num_games, secret_words, pool)
+        elif training_workers(num_games, num_workers) > 1:
+            pool = create_training_pool(self.word_list, training_workers(num_games, num_workers))
+            try:
+                games = self._play_parallel(ai, num_games, secret_words, pool)
+            finally:
+                pool.executor.shutdown()
+        else:
+            games = self._play_sequential(ai, num_games, secret_words)
 
+        for i, (secret_word, won, attempts, guesses) in enumerate(games):
             # Record results
             if won:
                 wins += 1
@@ -223,13 +248,7 @@ class WordleTrainer:
             else:
                 failures += 1
 
-            self.results.append({
-                "game": i + 1,
-                "won": won,
-                "attempts": attempts if won else 6,
-                "secret_word": game.secret_word,
-                "guesses": ai.guess_history.copy()
-            })
+            self.results.append(GameResult(i + 1, won, attempts if won else 6, secret_word, guesses))
 
         # Calculate statistics
         win_rate = (wins / num_games) * 100 if num_games > 0 else 0
@@ -246,3 +265,151 @@ class WordleTrainer:
         }
 
         return stats
+
+    def _play_sequential(self, ai: WordleAI, num_games: int, secret_words: List[str] = None):
+        """Play games one after another, yielding (secret_word, won, attempts, guesses)"""
+        # One game is reused across all rounds
+        game = WordleGame(self.word_list)
+
+        for i in range(num_games):
+            if secret_words and i < len(secret_words):
+                # Use provided secret word for testing
+                game.reset(secret_words[i])
+            else:
+                game.reset()
+
+            won, attempts = _play_game(ai, game)
+            yield game.secret_word, won, attempts, tuple(ai.guess_history)
+
+    def _play_parallel(self, ai: WordleAI, num_games: int, secret_words: List[str],
+                       pool: TrainingPool) -> List[Tuple[str, bool, int, Tuple[str, ...]]]:
+        """
+        Play games in a pool of worker processes, each with its own copy of the AI
+
+        Workers memory-map the pattern matrix from the on-disk cache. If it
+        could not be cached, it is placed in shared memory instead so workers
+        don't each compute their own copy
+        """
+        secrets = [secret_words[i] if secret_words and i < len(secret_words)
+                   else random.choice(self.word_list) for i in range(num_games)]
+
+        shm = None
+        shape = None
+        if ai.strategy in _PATTERN_STRATEGIES:
+            # Loads the matrix from the cache, or computes and caches it
+            pattern = ai.helper.pattern
+            if not isinstance(pattern, np.memmap):
+                shape = pattern.shape
+                shm = shared_memory.SharedMemory(create=True, size=max(pattern.nbytes, 1))
+                np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)[:] = pattern
+
+        try:
+            tasks = [(ai.strategy, ai.scoring, secret_word, shm.name if shm else None, shape)
+                     for secret_word in secrets]
+            chunksize = max(1, num_games // (pool.num_workers * 4))
+            return list(pool.executor.map(_play_worker, tasks, chunksize=chunksize))
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+
+def training_workers(num_games: int, num_workers: int) -> int:
+    """Number of worker processes worth starting to play num_games games"""
+    return max(1, min(num_workers, num_games // MIN_GAMES_PER_WORKER))
+
+
+def create_training_pool(word_list: List[str], num_workers: int) -> TrainingPool:
+    """
+    Start worker processes to play training games in
+
+    Workers are spawned rather than forked, since forking after numba has
+    started its thread pool can deadlock. The pool can be passed to several
+    WordleTrainer.train calls (with any strategy) on the same word list, and
+    is closed with pool.executor.shutdown()
+    """
+    executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=get_context("spawn"),
+                                   initializer=_init_worker, initargs=(word_list,))
+    return TrainingPool(executor, num_workers)
+
+
+def _play_game(ai: WordleAI, game) -> Tuple[bool, int]:
+    """
+    Play a single game with the AI
+
+    Returns:
+        Tuple of (won, attempts)
+    """
+    ai.reset()
+
+    # Play the game
+    attempts = 0
+    won = False
+
+    while not game.game_over and attempts < 6:
+        attempts += 1
+        guess = ai.make_guess(attempts)
+        success, feedback = game.make_guess(guess)
+
+        if success:
+            ai.process_feedback(guess, feedback)
+            if game.won:
+                won = True
+                break
+        else:
+            # Should not happen if AI is working correctly
+            print(f"Warning: Invalid guess {guess}")
+            break
+
+    return won, attempts
+
+
+# Word list, game and AIs (by strategy and scoring) of a training worker process
+_worker_words = None
+_worker_game = None
+_worker_ais: Dict[Tuple[str, str], WordleAI] = {}
+# Shared memory pattern matrix, attached on the first game that passes one
+_worker_shm = None
+_worker_pattern = None
+
+
+def _init_worker(word_list: List[str]):
+    """Set up the game for a training worker"""
+    global _worker_words, _worker_game
+
+    _worker_words = word_list
+    _worker_game = WordleGame(word_list)
+
+    if NUMBA_AVAILABLE:
+        # Games already run in parallel, so keep each worker's kernels single-threaded
+        from numba import set_num_threads
+        set_num_threads(1)
+
+
+def _play_worker(task: Tuple[str, str, str, Optional[str], Optional[Tuple[int, int]]]
+                 ) -> Tuple[str, bool, int, Tuple[str, ...]]:
+    """
+    Play one game in a training worker
+
+    The task is (strategy, scoring, secret_word, shm_name, shape), where
+    shm_name names a shared memory pattern matrix of the given shape, or is
+    None if the AI should load it from the cache
+    """
+    global _worker_shm, _worker_pattern
+    strategy, scoring, secret_word, shm_name, shape = task
+
+    ai = _worker_ais.get((strategy, scoring))
+    if ai is None:
+        ai = _worker_ais[strategy, scoring] = WordleAI(_worker_words, strategy=strategy, scoring=scoring)
+
+    if shm_name is not None:
+        # All matrices passed to a pool are for the same word list, so the first one is kept
+        if _worker_pattern is None:
+            _worker_shm = shared_memory.SharedMemory(name=shm_name)
+            _worker_pattern = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+        ai.helper.pattern = _worker_pattern
+
+    _worker_game.reset(secret_word)
+
+    won, attempts = _play_game(ai, _worker_game)
+    return secret_word, won, attempts, tuple(ai.guess_history)
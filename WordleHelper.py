@@ -1,5 +1,383 @@
-from typing import List, Set, Tuple, Dict
-from collections import Counter
+from typing import List, Set, Tuple, Dict, Optional
+import hashlib
+import os
+import numpy as np
+
+# The compiled kernels in _wordle_core.pyx are optional (python setup.py build_ext --inplace)
+try:
+    import _wordle_core
+
+    CORE_AVAILABLE = True
+except ImportError:
+    CORE_AVAILABLE = False
+
+# Numba is optional - it JIT compiles the kernels when the compiled ones are not built
+NUMBA_AVAILABLE = False
+if not CORE_AVAILABLE:
+    try:
+        from numba import njit, prange
+
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        pass
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory (LOCALAPPDATA on Windows, XDG_CACHE_HOME or ~/.cache elsewhere)"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wordle-ai-solver')
+
+
+# Default directory for precomputed pattern matrices
+CACHE_DIR = _user_cache_dir()
+
+# Version of the cached pattern matrix format, bump when the encoding changes
+PATTERN_FORMAT = 1
+
+# Feedback colors, packed per position as base-3 digits of a pattern (0-242)
+GRAY, YELLOW, GREEN = 0, 1, 2
+NUM_PATTERNS = 3 ** 5
+
+# Entropies (at most log2(243) < 8 bits) are stored as Q3.13 fixed-point uint16
+ENTROPY_SCALE = 1 << 13
+
+
+def _letter_index(letter: str) -> int:
+    """Map an uppercase letter to its index in the alphabet (A=0 ... Z=25)"""
+    return ord(letter) - ord('A')
+
+
+def encode_words(words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode uppercase 5-letter words as NumPy arrays
+
+    Args:
+        words: List of uppercase 5-letter words
+
+    Returns:
+        Tuple of (letters, presence) where letters is an (N, 5) uint8 array of
+        letter indices (0-25) and presence is an (N, 26) uint8 array counting
+        how many times each letter appears in each word
+    """
+    n = len(words)
+    letters = (np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+               .reshape(n, 5) - ord('A'))
+    presence = np.zeros((n, 26), dtype=np.uint8)
+    np.add.at(presence, (np.arange(n)[:, None], letters), 1)
+    return np.ascontiguousarray(letters), presence
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select the indices of the k highest scores without sorting the whole array
+
+    Args:
+        scores: Array of scores
+        k: Number of indices to return
+
+    Returns:
+        Indices of the top k scores, highest first, with ties in index order
+        (the same order a stable descending sort would give)
+    """
+    n = len(scores)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Negated scores to sort on, widened first so unsigned scores can't wrap
+    # and float scores aren't truncated
+    neg = -scores.astype(np.float64 if np.issubdtype(scores.dtype, np.floating) else np.int64)
+    if k >= n:
+        return np.lexsort((np.arange(n), neg))
+
+    # The k-th highest score; everything above it is in, ties are taken in index order
+    threshold = scores[np.argpartition(scores, n - k)[n - k]]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    top = np.concatenate([above, ties])
+
+    return top[np.lexsort((top, neg[top]))]
+
+
+def _filter_numpy(arr: np.ndarray, word_masks: np.ndarray, idx: np.ndarray, greens: np.ndarray,
+                  yellow_mask: np.uint32, excluded: np.ndarray, gray_mask: np.uint32) -> np.ndarray:
+    """Filter candidate indices with vectorized NumPy mask operations"""
+    words = arr[idx]
+    masks = word_masks[idx]
+    mask = np.ones(len(idx), dtype=bool)
+
+    # Check green positions
+    green_pos = np.flatnonzero(greens >= 0)
+    mask &= (words[:, green_pos] == greens[green_pos]).all(axis=1)
+
+    # Check yellow letters (must be in word)
+    mask &= (masks & yellow_mask) == yellow_mask
+
+    # Check yellow and gray letters are not in the positions they were guessed at
+    mask &= ((excluded >> words) & 1 == 0).all(axis=1)
+
+    # Check gray letters (must not be in word)
+    mask &= (masks & gray_mask) == 0
+
+    return idx[mask]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _filter_numba(arr, word_masks, idx, greens, yellow_mask, excluded, gray_mask):
+        """Filter candidate indices with a Numba loop over the letter arrays"""
+        out = np.empty_like(idx)
+        n = 0
+
+        for k in range(len(idx)):
+            i = idx[k]
+            bits = word_masks[i]
+            if (bits & gray_mask) != 0 or (bits & yellow_mask) != yellow_mask:
+                continue
+
+            valid = True
+            for pos in range(5):
+                letter = arr[i, pos]
+                if (greens[pos] >= 0 and letter != greens[pos]) or (excluded[pos] >> letter) & 1:
+                    valid = False
+                    break
+
+            if valid:
+                out[n] = i
+                n += 1
+
+        return out[:n]
+
+
+def feedback_constraints(feedback: List[Tuple[str, str]]
+                         ) -> Tuple[np.ndarray, np.uint32, np.ndarray, np.uint32]:
+    """
+    Extract the filter constraints of a guess's feedback as letter indices and 26-bit letter masks
+
+    Args:
+        feedback: List of (letter, color) tuples where color is 'green', 'yellow', or 'gray'
+
+    Returns:
+        Tuple of (greens, yellow_mask, excluded, gray_mask) as taken by filter_indices
+    """
+    greens = np.full(5, -1, dtype=np.int8)  # position -> letter, -1 if not green
+    excluded = np.zeros(5, dtype=np.uint32)  # position -> letters it can't be
+    green_mask = 0  # letters that are green somewhere
+    yellow_mask = 0  # letters that are in word but not in these positions
+    gray_mask = 0  # letters not in word
+
+    for i, (letter, color) in enumerate(feedback):
+        index = _letter_index(letter)
+        bit = 1 << index
+        if color == 'green':
+            greens[i] = index
+            green_mask |= bit
+        elif color == 'yellow':
+            yellow_mask |= bit
+            excluded[i] |= bit
+        elif color == 'gray':
+            gray_mask |= bit
+            excluded[i] |= bit
+
+    # Only mark as gray if it's not marked as yellow or green elsewhere
+    gray_mask &= ~(yellow_mask | green_mask)
+
+    return greens, np.uint32(yellow_mask), excluded, np.uint32(gray_mask)
+
+
+def filter_indices(arr: np.ndarray, word_masks: np.ndarray, idx: np.ndarray, greens: np.ndarray,
+                   yellow_mask: np.uint32, excluded: np.ndarray, gray_mask: np.uint32) -> np.ndarray:
+    """
+    Keep the candidate words that satisfy a set of feedback constraints
+
+    Args:
+        arr: (N, 5) uint8 array of letter indices
+        word_masks: (N,) uint32 array of 26-bit letter presence masks
+        idx: Indices of the current candidate words
+        greens: (5,) int8 array with the required letter at each position, -1 if none
+        yellow_mask: 26-bit mask of letters the word must contain
+        excluded: (5,) uint32 array of 26-bit masks of letters not allowed at each position
+        gray_mask: 26-bit mask of letters the word must not contain
+
+    Returns:
+        Indices of the candidate words that match
+    """
+    if CORE_AVAILABLE:
+        return _wordle_core.filter_idx(arr, word_masks, np.ascontiguousarray(idx, dtype=np.int32),
+                                       greens, yellow_mask, excluded, gray_mask)
+    if NUMBA_AVAILABLE:
+        return _filter_numba(arr, word_masks, idx, greens, yellow_mask, excluded, gray_mask)
+    return _filter_numpy(arr, word_masks, idx, greens, yellow_mask, excluded, gray_mask)
+
+
+def _pattern_matrix_numpy(arr: np.ndarray, chunk_size: int = 256) -> np.ndarray:
+    """Compute the feedback pattern matrix in chunks of guesses using NumPy"""
+    n = len(arr)
+    pattern = np.empty((n, n), dtype=np.uint8)
+    weights = 3 ** np.arange(5)
+    targets = arr[None, :, :]
+
+    for start in range(0, n, chunk_size):
+        guesses = arr[start:start + chunk_size, None, :]
+        green = guesses == targets
+        chunk = (green * (GREEN * weights)).sum(axis=2)
+
+        for pos in range(5):
+            letter = guesses[:, :, pos, None]
+            # Copies of the letter in the target that are not already green
+            available = ((targets == letter) & ~green).sum(axis=2)
+            # Each earlier non-green copy in the guess uses up one of them
+            used = ((guesses[:, :, :pos] == letter) & ~green[:, :, :pos]).sum(axis=2)
+            chunk += (~green[:, :, pos] & (used < available)) * (YELLOW * weights[pos])
+
+        pattern[start:start + chunk_size] = chunk
+
+    return pattern
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _pattern_matrix_numba(arr):
+        """
+        Compute the feedback pattern matrix with a parallel Numba kernel
+
+        Letter counts are packed as 4-bit fields into two uint64 words
+        (letters 0-15 and 16-25), so both passes update them with shifts
+        and masks instead of branching on the colors
+        """
+        n = arr.shape[0]
+        pattern = np.empty((n, n), dtype=np.uint8)
+        one = np.uint64(1)
+        field_mask = np.uint64(15)
+
+        for g in prange(n):
+            counts = np.zeros(2, dtype=np.uint64)
+            for t in range(n):
+                counts[0] = 0
+                counts[1] = 0
+
+                # First pass: count target letters not matched by a green
+                for pos in range(5):
+                    letter = arr[t, pos]
+                    miss = np.uint64(arr[g, pos] != letter)
+                    counts[letter >> 4] += miss << np.uint64(4 * (letter & 15))
+
+                # Second pass: greens, then yellows against the remaining counts
+                code = 0
+                weight = 1
+                for pos in range(5):
+                    letter = arr[g, pos]
+                    half = letter >> 4
+                    shift = np.uint64(4 * (letter & 15))
+                    green = np.uint64(letter == arr[t, pos])
+                    available = np.uint64(((counts[half] >> shift) & field_mask) != 0)
+                    yellow = (one - green) & available
+                    counts[half] -= yellow << shift
+                    code += (GREEN * green + YELLOW * yellow) * weight
+                    weight *= 3
+
+                pattern[g, t] = code
+
+        return pattern
+
+
+def _xlogx_table(n_targets: int) -> np.ndarray:
+    """c * log2(c) for every pattern count c from 0 to n_targets"""
+    counts = np.arange(n_targets + 1, dtype=np.float64)
+    return counts * np.log2(np.maximum(counts, 1))
+
+
+# All entropy kernels compute H = (T log2 T - sum(c log2 c)) / T from the same
+# xlogx table, summing over patterns in order, and round with floor(H * scale + 0.5),
+# so every backend returns the same scores
+
+def _entropies_numpy(pattern: np.ndarray, candidates_idx: np.ndarray, target_idx: np.ndarray,
+                     xlogx: np.ndarray, scale: float, chunk_size: int = 1 << 22) -> np.ndarray:
+    """Compute feedback entropies with one bincount per chunk of candidates"""
+    n_targets = len(target_idx)
+    entropies = np.empty(len(candidates_idx), dtype=np.uint16)
+    rows = max(1, chunk_size // max(n_targets, 1))
+
+    for start in range(0, len(candidates_idx), rows):
+        sub = pattern[candidates_idx[start:start + rows]][:, target_idx]
+        # Offset each row so a single bincount builds all the row histograms
+        offsets = np.arange(len(sub))[:, None] * NUM_PATTERNS
+        hist = np.bincount((sub + offsets).ravel(), minlength=len(sub) * NUM_PATTERNS)
+        hist = hist.reshape(len(sub), NUM_PATTERNS)
+        terms = xlogx[hist]
+        total = np.zeros(len(sub))
+        for k in range(NUM_PATTERNS):
+            total += terms[:, k]
+        entropy = (xlogx[n_targets] - total) / n_targets
+        entropies[start:start + rows] = np.floor(np.maximum(entropy, 0) * scale + 0.5)
+
+    return entropies
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _entropies_numba(pattern, candidates_idx, target_idx, xlogx, scale):
+        """Compute feedback entropies with a parallel Numba kernel"""
+        n_targets = len(target_idx)
+        entropies = np.empty(len(candidates_idx), dtype=np.uint16)
+
+        for c in prange(len(candidates_idx)):
+            g = candidates_idx[c]
+            counts = np.zeros(NUM_PATTERNS, dtype=np.int32)
+            for j in range(n_targets):
+                counts[pattern[g, target_idx[j]]] += 1
+
+            total = 0.0
+            for k in range(NUM_PATTERNS):
+                if counts[k] > 0:
+                    total += xlogx[counts[k]]
+            entropy = (xlogx[n_targets] - total) / n_targets
+            entropies[c] = np.uint16(np.floor(max(entropy, 0.0) * scale + 0.5))
+
+        return entropies
+
+
+def pattern_entropies(pattern: np.ndarray, candidates_idx: np.ndarray,
+                      target_idx: np.ndarray) -> np.ndarray:
+    """
+    Compute the feedback entropy of several guesses at once
+
+    Args:
+        pattern: (N, N) feedback pattern matrix
+        candidates_idx: Indices of the guesses to score
+        target_idx: Indices of the candidate secret words
+
+    Returns:
+        uint16 array with the entropy of each guess in bits times ENTROPY_SCALE
+    """
+    xlogx = _xlogx_table(len(target_idx))
+    scale = float(ENTROPY_SCALE)
+    if CORE_AVAILABLE:
+        return _wordle_core.pattern_entropies(pattern, np.ascontiguousarray(candidates_idx, dtype=np.int32),
+                                              np.ascontiguousarray(target_idx, dtype=np.int32), xlogx, scale)
+    if NUMBA_AVAILABLE:
+        return _entropies_numba(pattern, candidates_idx, target_idx, xlogx, scale)
+    return _entropies_numpy(pattern, candidates_idx, target_idx, xlogx, scale)
+
+
+def compute_pattern_matrix(arr: np.ndarray) -> np.ndarray:
+    """
+    Compute the Wordle feedback pattern for every (guess, target) pair
+
+    Args:
+        arr: (N, 5) uint8 array of letter indices
+
+    Returns:
+        (N, N) uint8 array where pattern[g, t] is the feedback for guessing
+        word g when the secret is word t, packed as sum(color[i] * 3**i)
+    """
+    if CORE_AVAILABLE:
+        return _wordle_core.compute_pattern_matrix(arr)
+    if NUMBA_AVAILABLE:
+        return _pattern_matrix_numba(arr)
+    return _pattern_matrix_numpy(arr)
 
 
 class WordleHelper:
@@ -8,14 +386,85 @@ class WordleHelper:
     and providing strategic word selection
     """
 
-    def __init__(self, word_list: List[str]):
-        """Initialize with a list of valid words"""
-        self.all_words = [word.upper() for word in word_list if len(word) == 5]
-        self.possible_words = self.all_words.copy()
+    # Recommended starters shared by all helpers, keyed by (word list digest, top_n)
+    _starter_cache: Dict[Tuple[str, int], List[Tuple[str, float]]] = {}
+
+    def __init__(self, word_list: List[str], cache_dir: Optional[str] = CACHE_DIR):
+        """
+        Initialize with a list of valid words
+
+        Words must already be uppercase and 5 letters long (as returned by
+        load_words_from_file); guesses and feedback passed to the other
+        methods are assumed to be uppercase as well
+
+        Args:
+            word_list: List of valid words
+            cache_dir: Directory to save the pattern matrix in between runs (None to disable)
+        """
+        assert all(len(word) == 5 and word.isupper() for word in word_list), \
+            "word_list must contain uppercase 5-letter words"
+        self.all_words = list(word_list)
+
+        # Vectorized representation of the word list
+        self.arr, self.presence = encode_words(self.all_words)
+        # 26-bit masks with bit i set if letter i appears in the word
+        self.word_masks = ((self.presence > 0) @ (1 << np.arange(26))).astype(np.uint32)
+        self.idx = np.arange(len(self.all_words), dtype=np.int32)  # indices of the possible words
+        self._pattern = None  # feedback pattern matrix, computed on first use
+        self.cache_dir = cache_dir
+        # Identifies the word list in cache keys
+        self._digest = hashlib.sha1(''.join(self.all_words).encode('ascii')).hexdigest()
+        self._freq_cache = None  # letter frequencies of the current possible words
+
+    @property
+    def possible_words(self) -> List[str]:
+        """Words still consistent with the feedback so far (built from idx on each access)"""
+        return [self.all_words[i] for i in self.idx]
+
+    @property
+    def pattern(self) -> np.ndarray:
+        """(N, N) uint8 feedback pattern matrix, see compute_pattern_matrix"""
+        if self._pattern is None:
+            self._pattern = self._load_pattern()
+        return self._pattern
+
+    @pattern.setter
+    def pattern(self, pattern: np.ndarray):
+        self._pattern = pattern
+
+    def _load_pattern(self) -> np.ndarray:
+        """Memory-map the pattern matrix from the cache, computing and saving it if missing"""
+        if self.cache_dir is None:
+            return compute_pattern_matrix(self.arr)
+
+        n = len(self.all_words)
+        path = os.path.join(self.cache_dir, f"pattern_v{PATTERN_FORMAT}_{self._digest[:12]}.npy")
+        if os.path.exists(path):
+            try:
+                pattern = np.load(path, mmap_mode='r')
+                if pattern.shape == (n, n) and pattern.dtype == np.uint8:
+                    return pattern
+            except (OSError, ValueError):
+                pass
+            print(f"Warning: Ignoring invalid cached pattern matrix {path}")
+
+        pattern = compute_pattern_matrix(self.arr)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so other processes never see a partial matrix
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                np.save(file, pattern)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not cache pattern matrix in {self.cache_dir}: {e}")
+
+        return pattern
 
     def reset(self):
         """Reset the possible words to the full list"""
-        self.possible_words = self.all_words.copy()
+        self.idx = np.arange(len(self.all_words), dtype=np.int32)
+        self._freq_cache = None
 
     def filter_words(self, guess: str, feedback: List[Tuple[str, str]]) -> List[str]:
         """
@@ -28,67 +477,24 @@ class WordleHelper:
         Returns:
             List of words that match the feedback constraints
         """
-        guess = guess.upper()
-        filtered = []
-
-        # Extract constraints from feedback
-        green_positions = {}  # position -> letter
-        yellow_letters = set()  # letters that are in word but not in these positions
-        yellow_not_positions = {}  # letter -> set of positions it can't be
-        gray_letters = set()  # letters not in word
-
-        for i, (letter, color) in enumerate(feedback):
-            if color == 'green':
-                green_positions[i] = letter
-            elif color == 'yellow':
-                yellow_letters.add(letter)
-                if letter not in yellow_not_positions:
-                    yellow_not_positions[letter] = set()
-                yellow_not_positions[letter].add(i)
-            elif color == 'gray':
-                # Only mark as gray if it's not marked as yellow or green elsewhere
-                if letter not in yellow_letters and letter not in green_positions.values():
-                    gray_letters.add(letter)
+        self.filter_idx(guess, feedback)
+        return self.possible_words
 
-        # Filter words
-        for word in self.possible_words:
-            valid = True
-
-            # Check green positions
-            for pos, letter in green_positions.items():
-                if word[pos] != letter:
-                    valid = False
-                    break
-
-            if not valid:
-                continue
-
-            # Check yellow letters (must be in word but not in specified positions)
-            for letter in yellow_letters:
-                if letter not in word:
-                    valid = False
-                    break
-                # Check if letter is in any of the positions it shouldn't be
-                if letter in yellow_not_positions:
-                    for pos in yellow_not_positions[letter]:
-                        if word[pos] == letter:
-                            valid = False
-                            break
-
-            if not valid:
-                continue
+    def filter_idx(self, guess: str, feedback: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Filter possible words like filter_words, without building the word list
 
-            # Check gray letters (must not be in word)
-            for letter in gray_letters:
-                if letter in word:
-                    valid = False
-                    break
+        Returns:
+            Indices in all_words of the words that match the feedback constraints
+        """
+        greens, yellow_mask, excluded, gray_mask = feedback_constraints(feedback)
 
-            if valid:
-                filtered.append(word)
+        # Filter words
+        self.idx = filter_indices(self.arr, self.word_masks, self.idx, greens,
+                                  yellow_mask, excluded, gray_mask)
+        self._freq_cache = None
 
-        self.possible_words = filtered
-        return filtered
+        return self.idx
 
     def get_letter_frequencies(self, words: List[str] = None) -> Dict[str, int]:
         """
@@ -101,14 +507,21 @@ class WordleHelper:
             Dictionary mapping letter to frequency count
         """
         if words is None:
-            words = self.possible_words
+            # Frequencies only change when the possible words do
+            if self._freq_cache is None:
+                self._freq_cache = self._count_letters(self.presence[self.idx])
+            return self._freq_cache
+
+        _, presence = encode_words(words)
+        return self._count_letters(presence)
 
-        freq = Counter()
-        for word in words:
-            # Count unique letters in each word
-            freq.update(set(word))
+    @staticmethod
+    def _count_letters(presence: np.ndarray) -> Dict[str, int]:
+        """Count the words containing each letter from a presence matrix"""
+        # Count unique letters in each word
+        counts = (presence > 0).sum(axis=0)
 
-        return dict(freq)
+        return {chr(ord('A') + i): int(count) for i, count in enumerate(counts) if count}
 
     def get_position_frequencies(self, words: List[str] = None) -> List[Dict[str, int]]:
         """
@@ -121,16 +534,35 @@ class WordleHelper:
             List of 5 dictionaries, one for each position
         """
         if words is None:
-            words = self.possible_words
+            position_freq = self.position_freq(self.idx)
+        else:
+            letters, _ = encode_words(words)
+            position_freq = self._count_positions(letters)
 
-        position_freq = [Counter() for _ in range(5)]
-        for word in words:
-            for i, letter in enumerate(word):
-                position_freq[i][letter] += 1
+        return [{chr(ord('A') + i): int(count) for i, count in enumerate(pf) if count}
+                for pf in position_freq]
 
-        return [dict(pf) for pf in position_freq]
+    def position_freq(self, idx: np.ndarray = None) -> np.ndarray:
+        """
+        Count each letter at each position across a set of words
 
-    def score_word(self, word: str, words: List[str] = None) -> float:
+        Args:
+            idx: Indices of the words to analyze (defaults to current possible words)
+
+        Returns:
+            (5, 26) array where entry [p, i] counts words with letter i at position p
+        """
+        if idx is None:
+            idx = self.idx
+
+        return self._count_positions(self.arr[idx])
+
+    @staticmethod
+    def _count_positions(letters: np.ndarray) -> np.ndarray:
+        """Count letters per position from an (N, 5) letter index array"""
+        return np.stack([np.bincount(letters[:, pos], minlength=26) for pos in range(5)])
+
+    def score_word(self, word: str, words: List[str] = None, freq: Dict[str, int] = None) -> float:
         """
         Score a word based on letter frequency
         Higher score = more common letters = better for elimination
@@ -138,53 +570,151 @@ class WordleHelper:
         Args:
             word: Word to score
             words: List of words to base frequency on (defaults to current possible words)
+            freq: Precomputed letter frequencies to use instead of words
 
         Returns:
             Score for the word
         """
-        if words is None:
-            words = self.possible_words
-
-        word = word.upper()
-        freq = self.get_letter_frequencies(words)
+        if freq is None:
+            freq = self.get_letter_frequencies(words)
 
         # Score based on unique letters (avoid double letters for better elimination)
         score = sum(freq.get(letter, 0) for letter in set(word))
 
         return score
 
-    def get_best_guess(self, use_remaining_only: bool = True) -> str:
+    def score_words(self, idx: np.ndarray, freq: Dict[str, int] = None) -> np.ndarray:
+        """
+        Score several words at once based on letter frequency (see score_word)
+
+        Args:
+            idx: Indices of the words to score in all_words
+            freq: Letter frequencies to score against (defaults to current possible words)
+
+        Returns:
+            Array with the score of each word
+        """
+        if freq is None:
+            freq = self.get_letter_frequencies()
+
+        freq_vec = np.array([freq.get(chr(ord('A') + i), 0) for i in range(26)], dtype=np.int64)
+        masks = self.word_masks[idx]
+
+        scores = np.zeros(len(idx), dtype=np.int64)
+        for i in range(26):
+            scores += ((masks >> i) & 1) * freq_vec[i]
+
+        return scores
+
+    def positional_entropy_score(self, word_idx, idx: np.ndarray = None):
+        """
+        Score words by the information their per-position green/not-green feedback gives
+
+        Args:
+            word_idx: Index (or array of indices) of the words to score in all_words
+            idx: Indices of the candidate secret words (defaults to current possible words)
+
+        Returns:
+            Sum over positions of the binary entropy (in bits) of a green at that position,
+            as a float or an array matching word_idx
+        """
+        if idx is None:
+            idx = self.idx
+
+        pf = self.position_freq(idx)
+        q = pf[np.arange(5), self.arr[word_idx]] / len(idx)
+        # Binary entropy per position, taking 0 * log2(0) as 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            h = -(q * np.log2(q) + (1 - q) * np.log2(1 - q))
+
+        return np.nan_to_num(h).sum(axis=-1)
+
+    def entropy_score(self, g: int, idx: np.ndarray = None) -> float:
+        """
+        Score a word by the expected information (in bits) its feedback gives
+
+        Args:
+            g: Index of the word to score in all_words
+            idx: Indices of the candidate secret words (defaults to current possible words)
+
+        Returns:
+            Entropy of the feedback pattern distribution over the candidates
+        """
+        if idx is None:
+            idx = self.idx
+
+        counts = np.bincount(self.pattern[g, idx], minlength=NUM_PATTERNS)
+        p = counts[counts > 0] / len(idx)
+
+        return float(-(p * np.log2(p)).sum())
+
+    def best_guess_entropy(self, candidates_idx: np.ndarray, target_idx: np.ndarray = None) -> int:
         """
-        Get the best guess based on letter frequency
+        Find the guess with the highest expected information gain
+
+        Args:
+            candidates_idx: Indices of the guesses to consider
+            target_idx: Indices of the candidate secret words (defaults to current possible words)
+
+        Returns:
+            Index in all_words of the best guess
+        """
+        if target_idx is None:
+            target_idx = self.idx
+
+        entropies = pattern_entropies(self.pattern, candidates_idx, target_idx)
+
+        return int(candidates_idx[entropies.argmax()])
+
+    def get_best_guess(self, use_remaining_only: bool = True, scoring: str = "letter") -> str:
+        """
+        Get the best guess based on letter frequency or information gain
 
         Args:
             use_remaining_only: If True, only consider words from possible_words
+                              scored by the scoring method
                               If False, consider all words for better elimination
+                              scored by expected information gain
+            scoring: How to score remaining words ('letter' for letter frequency,
+                     'positional' for positional entropy)
 
         Returns:
             Best word to guess
         """
-        if not self.possible_words:
+        if len(self.idx) == 0:
             return None
 
         # If only one word left, return it
-        if len(self.possible_words) == 1:
-            return self.possible_words[0]
+        if len(self.idx) == 1:
+            return self.all_words[self.idx[0]]
 
         # If few words left, just pick from remaining
-        if len(self.possible_words) <= 2 or use_remaining_only:
-            candidate_words = self.possible_words
-        else:
+        if len(self.idx) > 2 and not use_remaining_only:
             # Use all words for better elimination strategy
-            candidate_words = self.all_words
+            return self.all_words[self.best_guess_entropy(np.arange(len(self.all_words)))]
 
-        # Score all candidates
-        scored_words = [(word, self.score_word(word)) for word in candidate_words]
+        # Score remaining candidates and return best
+        scores = self.score_candidates(self.idx, scoring)
 
-        # Sort by score (descending) and return best
-        scored_words.sort(key=lambda x: x[1], reverse=True)
+        return self.all_words[self.idx[scores.argmax()]]
 
-        return scored_words[0][0]
+    def score_candidates(self, idx: np.ndarray, scoring: str = "letter") -> np.ndarray:
+        """
+        Score words with the given scoring method
+
+        Args:
+            idx: Indices in all_words of the words to score
+            scoring: 'letter' for letter frequency, 'positional' for positional entropy
+
+        Returns:
+            Array of scores, one per word in idx
+        """
+        if scoring == "letter":
+            return self.score_words(idx)
+        elif scoring == "positional":
+            return self.positional_entropy_score(idx)
+        else:
+            raise ValueError(f"Unknown scoring: {scoring}")
 
     def get_recommended_starters(self, top_n: int = 10) -> List[Tuple[str, float]]:
         """
@@ -196,8 +726,12 @@ class WordleHelper:
         Returns:
             List of (word, score) tuples
         """
-        scored_words = [(word, self.score_word(word, self.all_words))
-                        for word in self.all_words]
-        scored_words.sort(key=lambda x: x[1], reverse=True)
-
-        return scored_words[:top_n]
+        # Starters only depend on the word list, so compute them once per list
+        key = (self._digest, top_n)
+        if key not in self._starter_cache:
+            freq = self.get_letter_frequencies(self.all_words)
+            scores = self.score_words(np.arange(len(self.all_words)), freq)
+            top = top_k_indices(scores, top_n)
+            self._starter_cache[key] = [(self.all_words[i], int(scores[i])) for i in top]
+
+        return list(self._starter_cache[key])
@@ -0,0 +1,137 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled versions of the WordleHelper kernels
+
+Build in place with: python setup.py build_ext --inplace
+
+WordleHelper uses these when the extension is importable, which avoids the
+JIT compile and import cost of Numba on every run
+"""
+import numpy as np
+from libc.math cimport floor
+from libc.stdint cimport uint8_t, int8_t, int32_t, uint16_t, uint32_t, uint64_t
+
+# Must match the constants in WordleHelper (test_wordle_helper.py checks the kernels agree)
+cdef enum:
+    YELLOW = 1
+    GREEN = 2
+    NUM_PATTERNS = 243
+
+
+cpdef compute_pattern_matrix(const uint8_t[:, ::1] arr):
+    """
+    Compute the feedback pattern for every (guess, target) pair
+
+    Letter counts are packed as 4-bit fields into two uint64 words
+    (letters 0-15 and 16-25), as in the Numba kernel
+    """
+    cdef Py_ssize_t n = arr.shape[0]
+    cdef Py_ssize_t g, t, pos
+    cdef uint64_t counts[2]
+    cdef uint64_t green, yellow, available, shift
+    cdef uint8_t letter
+    cdef int half, code, weight
+
+    pattern_arr = np.empty((n, n), dtype=np.uint8)
+    cdef uint8_t[:, ::1] pattern = pattern_arr
+
+    with nogil:
+        for g in range(n):
+            for t in range(n):
+                counts[0] = 0
+                counts[1] = 0
+
+                # First pass: count target letters not matched by a green
+                for pos in range(5):
+                    letter = arr[t, pos]
+                    counts[letter >> 4] += (<uint64_t>(arr[g, pos] != letter)) << (4 * (letter & 15))
+
+                # Second pass: greens, then yellows against the remaining counts
+                code = 0
+                weight = 1
+                for pos in range(5):
+                    letter = arr[g, pos]
+                    half = letter >> 4
+                    shift = 4 * (letter & 15)
+                    green = letter == arr[t, pos]
+                    available = ((counts[half] >> shift) & 15) != 0
+                    yellow = (1 - green) & available
+                    counts[half] -= yellow << shift
+                    code += <int>(GREEN * green + YELLOW * yellow) * weight
+                    weight *= 3
+
+                pattern[g, t] = code
+
+    return pattern_arr
+
+
+cpdef filter_idx(const uint8_t[:, ::1] arr, const uint32_t[::1] presence_bits, const int32_t[::1] idx,
+                 const int8_t[::1] greens, uint32_t yellow_mask, const uint32_t[::1] excluded,
+                 uint32_t gray_mask):
+    """Keep the candidate words that satisfy a set of feedback constraints"""
+    cdef Py_ssize_t k, pos
+    cdef Py_ssize_t n = 0
+    cdef int32_t i
+    cdef uint32_t bits
+    cdef uint8_t letter
+    cdef bint valid
+
+    out_arr = np.empty(idx.shape[0], dtype=np.int32)
+    cdef int32_t[::1] out = out_arr
+
+    with nogil:
+        for k in range(idx.shape[0]):
+            i = idx[k]
+            bits = presence_bits[i]
+            if (bits & gray_mask) != 0 or (bits & yellow_mask) != yellow_mask:
+                continue
+
+            valid = True
+            for pos in range(5):
+                letter = arr[i, pos]
+                if (greens[pos] >= 0 and letter != greens[pos]) or (excluded[pos] >> letter) & 1:
+                    valid = False
+                    break
+
+            if valid:
+                out[n] = i
+                n += 1
+
+    return out_arr[:n]
+
+
+cpdef pattern_entropies(const uint8_t[:, ::1] pattern, const int32_t[::1] candidates_idx,
+                        const int32_t[::1] target_idx, const double[::1] xlogx, double scale):
+    """
+    Compute the feedback entropy of several guesses as fixed-point uint16
+
+    Uses the same xlogx table, summation order and rounding as the
+    WordleHelper kernels, so the scores match them exactly
+    """
+    cdef Py_ssize_t c, j, k
+    cdef Py_ssize_t n_targets = target_idx.shape[0]
+    cdef int32_t counts[NUM_PATTERNS]
+    cdef int32_t g
+    cdef double entropy, total
+
+    out_arr = np.empty(candidates_idx.shape[0], dtype=np.uint16)
+    cdef uint16_t[::1] out = out_arr
+
+    with nogil:
+        for c in range(candidates_idx.shape[0]):
+            g = candidates_idx[c]
+            for k in range(NUM_PATTERNS):
+                counts[k] = 0
+            for j in range(n_targets):
+                counts[pattern[g, target_idx[j]]] += 1
+
+            total = 0.0
+            for k in range(NUM_PATTERNS):
+                if counts[k] > 0:
+                    total += xlogx[counts[k]]
+            entropy = (xlogx[n_targets] - total) / n_targets
+            if entropy < 0:
+                entropy = 0
+            out[c] = <uint16_t>floor(entropy * scale + 0.5)
+
+    return out_arr
@@ -0,0 +1,23 @@
+"""
+Build the optional compiled kernels
+
+    python setup.py build_ext --inplace
+
+Without Cython the package installs without them, and WordleHelper falls
+back to Numba or NumPy
+"""
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize([Extension("_wordle_core", ["_wordle_core.pyx"])])
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="wordle-ai-solver",
+    py_modules=["WordleHelper", "WordleAI", "wordle_copy", "train_ai"],
+    install_requires=["numpy"],
+    ext_modules=ext_modules,
+)
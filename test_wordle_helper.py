@@ -0,0 +1,83 @@
+"""
+Checks for WordleHelper and its kernel backends (run with: python -m pytest)
+"""
+import os
+import random
+
+import numpy as np
+import pytest
+
+import WordleHelper as W
+from WordleHelper import WordleHelper
+from wordle_copy import WordleGame, load_words_from_file
+
+WORDS = load_words_from_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), "word_list.txt"))
+
+
+def _filter(guess: str, secret: str) -> WordleHelper:
+    """Helper with its possible words filtered by the feedback for guess against secret"""
+    helper = WordleHelper(WORDS, cache_dir=None)
+    game = WordleGame(WORDS)
+    game.reset(secret)
+    helper.filter_words(guess, game.get_feedback(guess))
+    return helper
+
+
+def test_secret_survives_repeated_letter_feedback():
+    # A gray copy of a letter that is green or yellow elsewhere used to remove the secret
+    for guess, secret in [("MEMOS", "HOMIE"), ("MISES", "AQUAS")]:
+        assert secret in _filter(guess, secret).possible_words
+
+
+def test_secret_survives_random_feedback():
+    rng = random.Random(0)
+    for _ in range(300):
+        guess, secret = rng.choice(WORDS), rng.choice(WORDS)
+        possible = _filter(guess, secret).possible_words
+        assert secret in possible
+        assert guess == secret or guess not in possible
+
+
+def _backends():
+    """(name, pattern matrix, filter, entropies) kernels of each installed backend"""
+    backends = [pytest.param(W.compute_pattern_matrix, W.filter_indices, W.pattern_entropies, id="dispatch")]
+    if W.NUMBA_AVAILABLE:
+        backends.append(pytest.param(
+            W._pattern_matrix_numba, W._filter_numba,
+            lambda pattern, candidates, targets: W._entropies_numba(
+                pattern, candidates, targets, W._xlogx_table(len(targets)), float(W.ENTROPY_SCALE)),
+            id="numba"))
+    if W.CORE_AVAILABLE:
+        core = W._wordle_core
+        backends.append(pytest.param(
+            core.compute_pattern_matrix, core.filter_idx,
+            lambda pattern, candidates, targets: core.pattern_entropies(
+                pattern, candidates, targets, W._xlogx_table(len(targets)), float(W.ENTROPY_SCALE)),
+            id="cython"))
+    return backends
+
+
+@pytest.mark.parametrize("pattern_matrix, filter_kernel, entropies", _backends())
+def test_backends_match_numpy(pattern_matrix, filter_kernel, entropies):
+    # Every kernel exists once per backend, so check each against the NumPy one
+    rng = np.random.default_rng(0)
+    words = [WORDS[i] for i in sorted(rng.choice(len(WORDS), 400, replace=False))]
+    helper = WordleHelper(words, cache_dir=None)
+    n = len(words)
+
+    pattern = W._pattern_matrix_numpy(helper.arr)
+    assert np.array_equal(pattern_matrix(helper.arr), pattern)
+
+    game = WordleGame(words)
+    for _ in range(50):
+        guess, secret = words[rng.integers(n)], words[rng.integers(n)]
+        game.reset(secret)
+        idx = np.sort(rng.choice(n, rng.integers(1, n), replace=False)).astype(np.int32)
+        args = (helper.arr, helper.word_masks, idx, *W.feedback_constraints(game.get_feedback(guess)))
+        assert np.array_equal(filter_kernel(*args), W._filter_numpy(*args))
+
+    candidates = np.arange(n, dtype=np.int32)
+    for size in [1, 2, 25, n]:
+        targets = np.sort(rng.choice(n, size, replace=False)).astype(np.int32)
+        expected = W._entropies_numpy(pattern, candidates, targets, W._xlogx_table(size), float(W.ENTROPY_SCALE))
+        assert np.array_equal(entropies(pattern, candidates, targets), expected)
@@ -4,9 +4,10 @@ Wordle AI Training Script
 Train and evaluate different AI strategies for playing Wordle
 """
 
+import os
 import sys
 from typing import List
-from WordleAI import WordleAI, WordleTrainer
+from WordleAI import WordleAI, WordleTrainer, create_training_pool, training_workers
 from wordle_copy import WordleGame, load_words_from_file
 
 # Try to import rich for better terminal output
@@ -24,6 +25,9 @@ except ImportError:
     RICH_AVAILABLE = False
     print("Note: Install 'rich' for better visualization: pip install rich")
 
+# Games are independent, so long training runs spread them across all cores
+NUM_WORKERS = os.cpu_count() or 1
+
 
 class TrainingUI:
     """UI handler for training visualization"""
@@ -78,7 +82,7 @@ class TrainingUI:
             print(f"Attempt {i + 1}: ", end="")
             self.print_feedback_colored(guess, feedback)
 
-        remaining = len(ai.helper.possible_words)
+        remaining = len(ai.helper.idx)
         print(f"\nRemaining possible words: {remaining}")
 
     def show_statistics(self, stats: dict):
@@ -164,7 +168,7 @@ def demo_single_game(word_list: List[str], strategy: str = "adaptive", show_step
             ai.process_feedback(guess, feedback)
 
             # Show remaining possibilities
-            remaining = len(ai.helper.possible_words)
+            remaining = len(ai.helper.idx)
             print(f"Remaining possible words: {remaining}")
 
             if show_steps and remaining <= 10:
@@ -195,17 +199,25 @@ def train_multiple_strategies(word_list: List[str], num_games: int = 100):
 
     results = {}
 
-    for strategy in strategies:
-        print(f"\nTraining '{strategy}' strategy...")
+    # Start the workers once for all strategies, if the run is long enough to need them
+    num_workers = training_workers(num_games, NUM_WORKERS)
+    pool = create_training_pool(word_list, num_workers) if num_workers > 1 else None
+
+    try:
+        for strategy in strategies:
+            print(f"\nTraining '{strategy}' strategy...")
 
-        ai = WordleAI(word_list, strategy=strategy)
-        trainer = WordleTrainer(word_list)
+            ai = WordleAI(word_list, strategy=strategy)
+            trainer = WordleTrainer(word_list)
 
-        stats = trainer.train(ai, num_games)
-        results[strategy] = stats
+            stats = trainer.train(ai, num_games, pool=pool)
+            results[strategy] = stats
 
-        print(f"  Win Rate: {stats['win_rate']:.2f}%")
-        print(f"  Avg Attempts: {stats['average_attempts']:.2f}")
+            print(f"  Win Rate: {stats['win_rate']:.2f}%")
+            print(f"  Avg Attempts: {stats['average_attempts']:.2f}")
+    finally:
+        if pool is not None:
+            pool.executor.shutdown()
 
     # Show comparison
     ui.print_header("Strategy Comparison")
@@ -285,7 +297,7 @@ def main():
             trainer = WordleTrainer(word_list)
 
             print(f"\nTraining '{strategy}' strategy with {num_games} games...")
-            stats = trainer.train(ai, num_games)
+            stats = trainer.train(ai, num_games, num_workers=NUM_WORKERS)
 
             ui.show_statistics(stats)
             input("\nPress Enter to continue...")
@@ -306,7 +318,7 @@ def main():
             ai = WordleAI(word_list, strategy=strategy)
             trainer = WordleTrainer(word_list)
 
-            stats = trainer.train(ai, num_games)
+            stats = trainer.train(ai, num_games, num_workers=NUM_WORKERS)
             ui.show_statistics(stats)
             input("\nPress Enter to continue...")
 
@@ -17,10 +17,18 @@ class WordleGame:
         if not self.word_list:
             raise ValueError("No valid 5-letter words provided")
         
-        self.secret_word = random.choice(self.word_list)
+        self.word_set = set(self.word_list)  # for fast guess validation
+        self.max_attempts = 6
+        self.reset()
+
+    def reset(self, secret_word: str = None):
+        """
+        Start a new game with the same word list.
+        If no secret word provided, picks a random one from the list.
+        """
+        self.secret_word = secret_word if secret_word else random.choice(self.word_list)
         self.attempts = []
         self.feedback_history = []
-        self.max_attempts = 6
         self.game_over = False
         self.won = False
 
@@ -66,7 +74,7 @@ class WordleGame:
         if len(guess) != 5:
             return False, "Guess must be 5 letters!"
         
-        if guess not in self.word_list:
+        if guess not in self.word_set:
             return False, "Word not in word list!"
         
         if guess in self.attempts: